@@ -26,6 +26,12 @@ Usage:
 
 Environment:
   - GITHUB_WORKSPACE (optional; defaults to cwd)
+
+Optional:
+  - --cache-dir DIR keeps bazel's repository cache and the yum/dnf package
+    cache per image under DIR on the host, so repeated local builds reuse
+    downloaded artifacts. Off by default; the container runs as root, so the
+    files are root-owned and DIR must be cleaned up manually.
 """
 
 from __future__ import annotations
@@ -36,7 +42,7 @@ import shlex
 import shutil
 import subprocess
 import sys
-from typing import List
+from typing import List, Tuple
 
 # Path to the container build script
 CONTAINER_SCRIPT_PATH = "ci/tasks/python_container_build_script.sh"
@@ -57,6 +63,17 @@ MANYLINUX_2_28_AARCH64_IMAGES = [
     "quay.io/pypa/manylinux_2_28_aarch64@sha256:817404d425b2edff4657a4bbf59e5a9fdb274609d31c99c1f9edc3be4426b00b",
 ]
 
+# Container paths that are backed by a persistent host cache directory. Only
+# bazel's repository cache is shared: it is content-addressed and safe to use
+# from concurrent builds, unlike the output base that `bazel clean --expunge`
+# removes at the end of every build.
+BAZEL_REPOSITORY_CACHE_DIR = "/var/cache/bazel-repo"
+CONTAINER_CACHE_DIRS = {
+    "bazel-repo": BAZEL_REPOSITORY_CACHE_DIR,
+    "yum": "/var/cache/yum",
+    "dnf": "/var/cache/dnf",
+}
+
 ARCH_ALIASES = {
     "X86": "x86",
     "X64": "x86",
@@ -87,6 +104,11 @@ def parse_args():
         default="",
         help="Path to host bazel executable to mount into the container",
     )
+    p.add_argument(
+        "--cache-dir",
+        default="",
+        help="Host directory for persistent bazel/yum caches (off by default)",
+    )
     p.add_argument("--release", action="store_true", help="Run in release mode")
     p.add_argument(
         "--dry-run", action="store_true", help="Print docker command without running"
@@ -117,6 +139,18 @@ def auditwheel_plat(platform_tag: str, arch_normalized: str) -> str:
     return f"{platform_tag}_{arch_tag}"
 
 
+def cache_mounts(cache_dir: str, image: str) -> List[Tuple[str, str]]:
+    if not cache_dir:
+        return []
+    # Key caches by image name so manylinux2014 and manylinux_2_28 don't collide.
+    image_tag = image.split("@", 1)[0].replace("/", "_").replace(":", "_")
+    base = os.path.join(os.path.abspath(cache_dir), image_tag)
+    return [
+        (os.path.join(base, name), container_dir)
+        for name, container_dir in CONTAINER_CACHE_DIRS.items()
+    ]
+
+
 def build_docker_cmd(
     workspace: str,
     image: str,
@@ -125,6 +159,7 @@ def build_docker_cmd(
     platform_tag: str,
     arch_normalized: str,
     release: bool = False,
+    cache_dir: str = "",
 ) -> List[str]:
     workspace = os.path.abspath(workspace)
     bazel_bin = os.path.abspath(bazel_bin)
@@ -149,6 +184,12 @@ def build_docker_cmd(
         f"{bazel_bin}:/usr/local/bin/bazel:ro",
     ]
 
+    mounts = cache_mounts(cache_dir, image)
+    for host_dir, container_dir in mounts:
+        cmd.extend(["-v", f"{host_dir}:{container_dir}"])
+    if mounts:
+        cmd.extend(["-e", f"BAZEL_REPOSITORY_CACHE={BAZEL_REPOSITORY_CACHE_DIR}"])
+
     if github_ref_name:
         cmd.extend(["-e", f"GITHUB_REF_NAME={github_ref_name}"])
 
@@ -186,6 +227,7 @@ def main() -> int:
         platform_tag,
         arch,
         release=args.release,
+        cache_dir=args.cache_dir,
     )
     printable = " ".join(shlex.quote(c) for c in docker_cmd)
     print(f"+ {printable}")
@@ -193,6 +235,9 @@ def main() -> int:
     if args.dry_run:
         return 0
 
+    for host_dir, _ in cache_mounts(args.cache_dir, image):
+        os.makedirs(host_dir, exist_ok=True)
+
     try:
         completed = subprocess.run(docker_cmd)
         if completed.returncode != 0:
@@ -34,15 +34,51 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+_CPP_BLOCK_RE = re.compile(r"```cpp\n(.*?)```", re.DOTALL)
+
+# Maps a token used in a code block to the headers it requires. RowEncoder
+# also implies Row because the regex alternation consumes the longer token.
+_TOKEN_INCLUDES = {
+    "std::string": ("#include <string>",),
+    "std::vector": ("#include <vector>",),
+    "std::map": ("#include <map>",),
+    "std::set": ("#include <set>",),
+    "std::unordered_map": ("#include <unordered_map>",),
+    "std::unordered_set": ("#include <unordered_set>",),
+    "std::optional": ("#include <optional>",),
+    "std::shared_ptr": ("#include <memory>",),
+    "std::unique_ptr": ("#include <memory>",),
+    "std::variant": ("#include <variant>",),
+    "std::chrono": ("#include <chrono>",),
+    "std::make_shared": ("#include <memory>",),
+    "std::make_unique": ("#include <memory>",),
+    "assert(": ("#include <cassert>",),
+    "std::cout": ("#include <iostream>",),
+    "RowEncoder": (
+        '#include "fory/encoder/row_encoder.h"',
+        '#include "fory/row/row.h"',
+    ),
+    "Row": ('#include "fory/row/row.h"',),
+}
+# Longest tokens first so that e.g. RowEncoder wins over Row.
+_TOKEN_RE = re.compile(
+    "|".join(map(re.escape, sorted(_TOKEN_INCLUDES, key=len, reverse=True)))
+)
+_INCLUDE_RE = re.compile(r'#include [<"][^>"\n]*[>"]')
+
 
 def extract_cpp_code_blocks(content: str) -> List[Tuple[str, int]]:
     # Extract C++ code blocks from markdown content.
     code_blocks = []
-    pattern = r"```cpp\n(.*?)```"
+    # Count newlines incrementally so each match only scans the text since
+    # the previous one instead of the whole prefix.
+    line_num = 1
+    pos = 0
 
-    for match in re.finditer(pattern, content, re.DOTALL):
+    for match in _CPP_BLOCK_RE.finditer(content):
         code = match.group(1).strip()
-        line_num = content[: match.start()].count("\n") + 1
+        line_num += content.count("\n", pos, match.start())
+        pos = match.start()
         code_blocks.append((code, line_num))
 
     return code_blocks
@@ -117,40 +153,11 @@ def wrap_code_as_test(code: str, doc_file: str, block_index: int) -> str:
     if "#include" not in code:
         includes.add('#include "fory/serialization/fory.h"')
 
-    if "std::string" in code and "#include <string>" not in code:
-        includes.add("#include <string>")
-    if "std::vector" in code and "#include <vector>" not in code:
-        includes.add("#include <vector>")
-    if "std::map" in code and "#include <map>" not in code:
-        includes.add("#include <map>")
-    if "std::set" in code and "#include <set>" not in code:
-        includes.add("#include <set>")
-    if "std::unordered_map" in code and "#include <unordered_map>" not in code:
-        includes.add("#include <unordered_map>")
-    if "std::unordered_set" in code and "#include <unordered_set>" not in code:
-        includes.add("#include <unordered_set>")
-    if "std::optional" in code and "#include <optional>" not in code:
-        includes.add("#include <optional>")
-    if "std::shared_ptr" in code and "#include <memory>" not in code:
-        includes.add("#include <memory>")
-    if "std::unique_ptr" in code and "#include <memory>" not in code:
-        includes.add("#include <memory>")
-    if "std::variant" in code and "#include <variant>" not in code:
-        includes.add("#include <variant>")
-    if "std::chrono" in code and "#include <chrono>" not in code:
-        includes.add("#include <chrono>")
-    if "std::make_shared" in code and "#include <memory>" not in code:
-        includes.add("#include <memory>")
-    if "std::make_unique" in code and "#include <memory>" not in code:
-        includes.add("#include <memory>")
-    if "assert(" in code and "#include <cassert>" not in code:
-        includes.add("#include <cassert>")
-    if "std::cout" in code and "#include <iostream>" not in code:
-        includes.add("#include <iostream>")
-    if "RowEncoder" in code and '#include "fory/encoder/row_encoder.h"' not in code:
-        includes.add('#include "fory/encoder/row_encoder.h"')
-    if "Row" in code and '#include "fory/row/row.h"' not in code:
-        includes.add('#include "fory/row/row.h"')
+    present = set(_INCLUDE_RE.findall(code))
+    for token in set(_TOKEN_RE.findall(code)):
+        for include in _TOKEN_INCLUDES[token]:
+            if include not in present:
+                includes.add(include)
 
     include_section = "\n".join(sorted(includes))
 
@@ -195,8 +202,7 @@ def process_markdown_file(
 ) -> List[Path]:
     # logging.info(f"Processing {md_path}")
 
-    with open(md_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = md_path.read_text(encoding="utf-8")
 
     code_blocks = extract_cpp_code_blocks(content)
     logging.info(f"  Found {len(code_blocks)} C++ code blocks")
@@ -315,18 +321,19 @@ def main():
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    all_test_files = []
-
-    for md_file in sorted(docs_dir.glob("*.md")):
-        test_files = process_markdown_file(md_file, output_dir)
-        all_test_files.extend(test_files)
+    md_files = sorted(docs_dir.glob("*.md"))
+    file_tags = [None] * len(md_files)
 
     for docs_file in args.docs_file:
         md_file = project_root / docs_file
         if not md_file.is_file():
             logging.error(f"Documentation file not found: {md_file}")
             sys.exit(1)
-        file_tag = f"{md_file.parent.name}-{md_file.stem}"
+        md_files.append(md_file)
+        file_tags.append(f"{md_file.parent.name}-{md_file.stem}")
+
+    all_test_files = []
+    for md_file, file_tag in zip(md_files, file_tags):
         test_files = process_markdown_file(md_file, output_dir, file_tag)
         all_test_files.extend(test_files)
 
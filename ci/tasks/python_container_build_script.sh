@@ -17,6 +17,14 @@
 # under the License.
 
 set -e
+# Keep downloaded packages so a package cache mounted from the host is reused.
+# On EL8 /etc/yum.conf is a symlink to dnf.conf, so only edit one of them.
+if [ -f /etc/dnf/dnf.conf ]; then
+    PKG_CONF=/etc/dnf/dnf.conf
+else
+    PKG_CONF=/etc/yum.conf
+fi
+sed -i -e '/^keepcache=/d' -e '/^\[main\]/a keepcache=1' "$PKG_CONF"
 yum install -y git sudo wget || true
 
 git config --global --add safe.directory /work
@@ -27,6 +35,10 @@ if ! command -v bazel >/dev/null 2>&1; then
 fi
 echo "Using bazel: $(bazel --version)"
 
+if [ -n "${BAZEL_REPOSITORY_CACHE:-}" ]; then
+    echo "common --repository_cache=$BAZEL_REPOSITORY_CACHE" >> ~/.bazelrc
+fi
+
 # Function to verify the installed version against expected version
 verify_version() {
     local installed_version=$1